@@ -4,28 +4,50 @@ Engine Testing Script for toto.c Chess Engine
 Tests basic UCI communication and engine functionality
 """
 
+import re
 import subprocess
+import threading
+import queue
 import time
 import os
 import sys
 
+# Lines that terminate a UCI reply
+_SENTINELS = ("uciok", "readyok", "bestmove")
+
+_BESTMOVE_RE = re.compile(r"^bestmove\s+(\S+)")
+
+def _parse_bestmove(line):
+    """Return the move from a 'bestmove <move> ...' line, or None"""
+    m = _BESTMOVE_RE.match(line) if line else None
+    return m.group(1) if m else None
+
+def _dir_entries(path="."):
+    """Return the set of file names in a directory (one scandir call)"""
+    return {e.name for e in os.scandir(path)}
+
 class EngineTest:
-    def __init__(self, engine_path="./toto_engine"):
+    def __init__(self, engine_path="./toto_engine", verbose=False):
         self.engine_path = engine_path
+        self.verbose = verbose  # pass "info" lines through to the reader queue
         self.process = None
+        self.out_q = None
 
     def start_engine(self):
         """Start the engine process"""
         try:
-            # Try different executable names
-            possible_names = [self.engine_path, f"{self.engine_path}.exe", "./toto_engine", "./toto_engine.exe"]
+            # Try the plain and .exe executable names
+            directory = os.path.dirname(self.engine_path) or "."
+            base = os.path.basename(self.engine_path)
+            possible_names = [base, f"{base}.exe"]
+            entries = _dir_entries(directory)
 
             for name in possible_names:
-                if os.path.exists(name):
-                    self.engine_path = name
+                if name in entries:
+                    self.engine_path = os.path.join(directory, name)
                     break
             else:
-                print(f"Engine executable not found. Tried: {possible_names}")
+                print(f"Engine executable not found. Tried: {possible_names} in {directory}")
                 return False
 
             print(f"Starting engine: {self.engine_path}")
@@ -33,10 +55,14 @@ class EngineTest:
                 [self.engine_path],
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True,
-                bufsize=0
+                stderr=subprocess.STDOUT,  # merged so the reader thread drains it
+                encoding="utf-8",
+                bufsize=1  # line buffered: UCI traffic is line-oriented
             )
+
+            # Drain stdout on a background thread so reads never poll
+            self.out_q = queue.Queue()
+            threading.Thread(target=self._reader, daemon=True).start()
             return True
 
         except Exception as e:
@@ -50,43 +76,52 @@ class EngineTest:
             self.process.stdin.write(command + "\n")
             self.process.stdin.flush()
 
-    def read_response(self, timeout=2.0):
-        """Read response from engine"""
+    def send_commands(self, commands):
+        """Send several commands to the engine in a single write"""
+        if self.process and self.process.stdin:
+            for command in commands:
+                print(f">>> {command}")
+            self.process.stdin.write("\n".join(commands) + "\n")
+            self.process.stdin.flush()
+
+    def _reader(self):
+        """Push engine output lines onto the queue until EOF"""
+        for line in self.process.stdout:
+            if not self.verbose and line.startswith("info "):
+                continue
+            self.out_q.put(line.strip())
+
+    def iter_responses(self, timeout=2.0):
+        """Yield engine output lines as they arrive, until timeout"""
         if not self.process:
-            return []
+            return
 
-        import select
+        deadline = time.monotonic() + timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                line = self.out_q.get(timeout=remaining)
+            except queue.Empty:
+                return
+            print(f"<<< {line}")
+            yield line
+
+    def read_until(self, sentinels, timeout=2.0):
+        """Read engine output until a line starts with one of sentinels (a tuple).
+
+        Returns (match, lines): the sentinel line (or None on timeout) and
+        every line read.
+        """
         responses = []
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            if os.name == 'nt':  # Windows
-                # Simple polling for Windows
-                time.sleep(0.1)
-                try:
-                    line = self.process.stdout.readline()
-                    if line:
-                        line = line.strip()
-                        print(f"<<< {line}")
-                        responses.append(line)
-                        if line.startswith("uciok") or line.startswith("readyok") or line.startswith("bestmove"):
-                            break
-                except:
-                    break
-            else:  # Unix-like systems
-                ready, _, _ = select.select([self.process.stdout], [], [], 0.1)
-                if ready:
-                    line = self.process.stdout.readline()
-                    if line:
-                        line = line.strip()
-                        print(f"<<< {line}")
-                        responses.append(line)
-                        if line.startswith("uciok") or line.startswith("readyok") or line.startswith("bestmove"):
-                            break
-                else:
-                    time.sleep(0.1)
-
-        return responses
+        for line in self.iter_responses(timeout):
+            responses.append(line)
+            if line.startswith(sentinels):
+                return line, responses
+
+        return None, responses
 
     def test_uci_protocol(self):
         """Test basic UCI protocol"""
@@ -94,9 +129,7 @@ class EngineTest:
 
         # Test UCI command
         self.send_command("uci")
-        responses = self.read_response()
-
-        uci_ok = any("uciok" in resp for resp in responses)
+        uci_ok, _ = self.read_until(("uciok",))
         if uci_ok:
             print("✓ UCI protocol initialized successfully")
         else:
@@ -105,9 +138,7 @@ class EngineTest:
 
         # Test isready command
         self.send_command("isready")
-        responses = self.read_response()
-
-        ready_ok = any("readyok" in resp for resp in responses)
+        ready_ok, _ = self.read_until(("readyok",))
         if ready_ok:
             print("✓ Engine is ready")
         else:
@@ -120,24 +151,15 @@ class EngineTest:
         """Test position setting and search"""
         print("\n=== Testing Position and Search ===")
 
-        # Set starting position
-        self.send_command("ucinewgame")
-        time.sleep(0.1)
-
-        self.send_command("position startpos moves e2e4")
-        time.sleep(0.1)
+        # Start a new game and wait for the engine to acknowledge it
+        self.send_commands(["ucinewgame", "isready"])
+        self.read_until(("readyok",), timeout=1.0)
 
-        # Search for best move
-        self.send_command("go movetime 1000")  # Search for 1 second
-        responses = self.read_response(timeout=3.0)
+        # Set position and search for best move (1 second)
+        self.send_commands(["position startpos moves e2e4", "go movetime 1000"])
+        match, _ = self.read_until(("bestmove",), timeout=3.0)
 
-        best_move = None
-        for resp in responses:
-            if resp.startswith("bestmove"):
-                parts = resp.split()
-                if len(parts) >= 2:
-                    best_move = parts[1]
-                    break
+        best_move = _parse_bestmove(match)
 
         if best_move:
             print(f"✓ Engine found best move: {best_move}")
@@ -158,18 +180,11 @@ class EngineTest:
 
         for position, description in positions:
             print(f"\nTesting: {description}")
-            self.send_command(f"position {position}")
-            self.send_command("go movetime 500")
+            self.send_commands([f"position {position}", "go movetime 500"])
 
-            responses = self.read_response(timeout=2.0)
-            best_move = None
+            match, _ = self.read_until(("bestmove",), timeout=2.0)
 
-            for resp in responses:
-                if resp.startswith("bestmove"):
-                    parts = resp.split()
-                    if len(parts) >= 2:
-                        best_move = parts[1]
-                        break
+            best_move = _parse_bestmove(match)
 
             if best_move:
                 print(f"  ✓ Best move: {best_move}")
@@ -181,6 +196,9 @@ class EngineTest:
         print("\n=== Interactive Mode ===")
         print("Enter UCI commands (type 'quit' to exit):")
 
+        # Show search info lines when testing by hand
+        self.verbose = True
+
         while True:
             try:
                 command = input(">>> ").strip()
@@ -190,8 +208,12 @@ class EngineTest:
                 self.send_command(command)
 
                 # Read responses for a short time
-                responses = self.read_response(timeout=1.0)
-                if not responses:
+                got_response = False
+                for line in self.iter_responses(timeout=1.0):
+                    got_response = True
+                    if line.startswith(_SENTINELS):
+                        break
+                if not got_response:
                     print("(no response)")
 
             except KeyboardInterrupt:
@@ -211,17 +233,13 @@ def main():
     print("Chess Engine Test Script")
     print("=" * 40)
 
-    # Check if engine exists
-    engine_paths = ["toto_engine", "toto_engine.exe", "./toto_engine", "./toto_engine.exe"]
-
-    engine_found = False
+    entries = _dir_entries()
 
-    for path in engine_paths:
-        if os.path.exists(path):
-            engine_found = True
-            break
+    # Check if engine exists
+    engine_names = ["toto_engine", "toto_engine.exe"]
+    engine_path = next((f"./{name}" for name in engine_names if name in entries), None)
 
-    if not engine_found:
+    if engine_path is None:
         print("Error: Chess engine not found!")
         print("Please compile toto.c first:")
         print("  gcc toto.c -o toto_engine")
@@ -232,7 +250,7 @@ def main():
 
     # Check for NNUE file
     nnue_files = ["nn-eba324f53044.nnue", "eval.nnue", "nnue.bin"]
-    nnue_found = any(os.path.exists(f) for f in nnue_files)
+    nnue_found = any(f in entries for f in nnue_files)
 
     if not nnue_found:
         print("Warning: NNUE file not found!")
@@ -241,7 +259,7 @@ def main():
         print()
 
     # Run tests
-    tester = EngineTest()
+    tester = EngineTest(engine_path=engine_path)
 
     try:
         if not tester.start_engine():
@@ -1,13 +1,15 @@
 
 # Requirements:
-#   pip install pygame python-chess
+#   pip install pygame python-chess numpy
 
 import os
 import sys
 import time
+import queue
 import threading
 from enum import Enum
 
+import numpy as np
 import pygame
 import chess
 import chess.engine
@@ -23,8 +25,33 @@ WIN_SIZE = (BOARD_SIZE + SIDE_PANEL_W, BOARD_SIZE)
 FPS = 60
 
 START_TIME = 300
+
+# Mixer settings: 48 kHz matches the bundled .wav files, so they load without
+# resampling. Small buffers cut click-to-sound latency; ALSA underruns below 512.
+AUDIO_FREQUENCY = 48000
+
+def _audio_buffer():
+    """Mixer buffer size: SYNAPSE_AUDIO_BUFFER if valid, else the platform default"""
+    default = 512 if sys.platform.startswith("linux") else 256
+    value = os.environ.get("SYNAPSE_AUDIO_BUFFER")
+    if value is None:
+        return default
+    try:
+        buffer = int(value)
+    except ValueError:
+        buffer = 0
+    if buffer <= 0:
+        print(f"Ignoring invalid SYNAPSE_AUDIO_BUFFER={value!r}, using {default}")
+        return default
+    return buffer
+
+AUDIO_BUFFER = _audio_buffer()
 ENGINE_PATH = os.path.join(os.path.dirname(__file__), "./engine")
 
+# Timer events for sounds that trail the move sound
+CHECK_SOUND_EVENT = pygame.USEREVENT + 1
+END_SOUND_EVENT = pygame.USEREVENT + 2
+
 LIGHT = (240, 217, 181)
 DARK = (181, 136,  99)
 BLUE = ( 66, 135, 245)
@@ -36,7 +63,10 @@ BLUE = ( 66, 135, 245)
 class ChessAudio:
     def __init__(self):
         """Initialize pygame mixer and load sound effects"""
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        # pygame.init() opens the mixer with default settings, which would
+        # make the init() below a no-op
+        pygame.mixer.quit()
+        pygame.mixer.init(frequency=AUDIO_FREQUENCY, size=-16, channels=2, buffer=AUDIO_BUFFER)
         self.sounds = {}
         self.audio_enabled = True
         self.load_sounds()
@@ -85,7 +115,7 @@ class ChessAudio:
     def create_beep(self, sound_type):
         """Create a simple beep sound as fallback"""
         duration = 0.1
-        sample_rate = 22050
+        sample_rate = pygame.mixer.get_init()[0]
         frames = int(duration * sample_rate)
         
         # Different frequencies for different sounds
@@ -100,13 +130,12 @@ class ChessAudio:
         
         freq = frequencies.get(sound_type, 440)
         
-        # Generate sine wave
-        arr = []
-        for i in range(frames):
-            wave = 4096 * pygame.math.sin(2 * pygame.math.pi * freq * i / sample_rate)
-            arr.append([int(wave), int(wave)])
+        # Generate sine wave (one column per stereo channel)
+        t = np.arange(frames, dtype=np.float32)
+        wave = (4096 * np.sin(2 * np.pi * freq * t / sample_rate)).astype(np.int16)
+        arr = np.column_stack([wave, wave])
         
-        sound = pygame.sndarray.make_sound(pygame.array.array('i', arr))
+        sound = pygame.sndarray.make_sound(arr)
         sound.set_volume(0.3)  # Make it quieter
         return sound
     
@@ -151,33 +180,74 @@ class ChessAudio:
         """Play game end sound"""
         self.play_sound('game_end')
 
+# ---------------------------------------------------------------------------
+# Helper: cached fonts
+# ---------------------------------------------------------------------------
+
+_FONTS = {}
+
+def get_font(name, size, bold=False):
+    """Return a SysFont, constructing it only on first use"""
+    key = (name, size, bold)
+    font = _FONTS.get(key)
+    if font is None:
+        font = _FONTS[key] = pygame.font.SysFont(name, size, bold)
+    return font
+
 # ---------------------------------------------------------------------------
 # Helper: load piece images
 # ---------------------------------------------------------------------------
 
+_raw_pieces = {}   # key -> full-size image loaded from disk (None if missing)
+_piece_cache = {}  # (key, size) -> scaled image
+
+def _load_raw_piece(key):
+    if key not in _raw_pieces:
+        path = os.path.join(os.path.dirname(__file__), "assets/pieces", f"{key}.png")
+        _raw_pieces[key] = pygame.image.load(path).convert_alpha() if os.path.exists(path) else None
+    return _raw_pieces[key]
+
+def get_piece(key, size):
+    """Return the image for key ('wK', 'bP', ...) at size px, scaling it only once"""
+    img = _piece_cache.get((key, size))
+    if img is None:
+        raw = _load_raw_piece(key)
+        if raw is not None:
+            img = pygame.transform.smoothscale(raw, (size, size)).convert_alpha()
+        else:
+            # Create a simple colored rectangle as fallback
+            color, letter = key
+            img = pygame.Surface((size, size), pygame.SRCALPHA)
+            color_val = (255, 255, 255) if color == 'w' else (0, 0, 0)
+            pygame.draw.rect(img, color_val, (0, 0, size, size))
+            font = pygame.font.Font(None, 36)
+            text = font.render(letter, True, (255, 0, 0) if color == 'w' else (255, 255, 0))
+            text_rect = text.get_rect(center=(size//2, size//2))
+            img.blit(text, text_rect)
+        _piece_cache[(key, size)] = img
+    return img
+
 def load_piece_images(square_px=SQUARE_SIZE):
-    piece_dir = os.path.join(os.path.dirname(__file__), "assets/pieces")
     images = {}
     for color in ('w', 'b'):
         for letter in ('K','Q','R','B','N','P'):
             key = color + letter
-            path = os.path.join(piece_dir, f"{key}.png")
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                images[key] = pygame.transform.smoothscale(img, (square_px, square_px))
-            else:
-                # Create a simple colored rectangle as fallback
-                img = pygame.Surface((square_px, square_px), pygame.SRCALPHA)
-                color_val = (255, 255, 255) if color == 'w' else (0, 0, 0)
-                pygame.draw.rect(img, color_val, (0, 0, square_px, square_px))
-                font = pygame.font.Font(None, 36)
-                text = font.render(letter, True, (255, 0, 0) if color == 'w' else (255, 255, 0))
-                text_rect = text.get_rect(center=(square_px//2, square_px//2))
-                img.blit(text, text_rect)
-                images[key] = img
+            images[key] = get_piece(key, square_px)
     return images
 
+def piece_image_table(images):
+    """Index piece images by piece_type | (color << 3) for lookup without string keys"""
+    table = [None]*16
+    for color, prefix in ((chess.WHITE, 'w'), (chess.BLACK, 'b')):
+        for piece_type in chess.PIECE_TYPES:
+            table[piece_type | (color << 3)] = images[prefix + chess.piece_symbol(piece_type).upper()]
+    return table
+
 PIECE_IMAGES = {}  # filled after pygame.init()
+PIECE_IMG_TABLE = []
+
+# Top-left pixel of each square (file = sq & 7, rank = sq >> 3), white at the bottom
+_SQ_PIXELS = [((sq & 7)*SQUARE_SIZE, (7-(sq >> 3))*SQUARE_SIZE) for sq in range(64)]
 
 # ---------------------------------------------------------------------------
 # Simple chess clock
@@ -189,25 +259,36 @@ class Clock:
             chess.WHITE: float(start_sec),
             chess.BLACK: float(start_sec)
         }
-        self.last_tick = time.time()
+        self.last_tick = time.monotonic()
+        # side -> ((secs, is_turn), label); labels re-render only when these change
+        self._last_rendered = {chess.WHITE: (None, None), chess.BLACK: (None, None)}
+
+    def reset(self, start_sec=START_TIME):
+        """Restore both sides to start_sec in place"""
+        self.remaining[chess.WHITE] = self.remaining[chess.BLACK] = float(start_sec)
+        self.last_tick = time.monotonic()
 
     def start_turn(self):
-        self.last_tick = time.time()
+        self.last_tick = time.monotonic()
 
     def stop_turn(self, side_to_move):
-        now = time.time()
+        now = time.monotonic()
         self.remaining[side_to_move] -= now - self.last_tick
 
     def flag(self):
         return any(t <= 0 for t in self.remaining.values())
 
     def draw(self, screen, turn_color):
-        font = pygame.font.SysFont("Consolas", 28)
         for side, y in ((chess.WHITE,20),(chess.BLACK,55)):
-            secs = max(0,int(self.remaining[side]))
-            txt = time.strftime("%M:%S", time.gmtime(secs))
-            col = BLUE if side == turn_color else (0,0,0)
-            label = font.render(f"{'White' if side==chess.WHITE else 'Black'}: {txt}", True, col)
+            state = (max(0,int(self.remaining[side])), side == turn_color)
+            shown, label = self._last_rendered[side]
+            if state != shown:
+                secs, is_turn = state
+                txt = time.strftime("%M:%S", time.gmtime(secs))
+                col = BLUE if is_turn else (0,0,0)
+                font = get_font("Consolas", 28)
+                label = font.render(f"{'White' if side==chess.WHITE else 'Black'}: {txt}", True, col)
+                self._last_rendered[side] = (state, label)
             screen.blit(label, (BOARD_SIZE+20, y))
 
 # ---------------------------------------------------------------------------
@@ -224,6 +305,10 @@ class ScrollableMoveLog:
         self.visible_lines = (height - 60)//self.line_height
         self.scroll_y = 0
         self.max_scroll = 0
+        self._title_surf = get_font("Verdana",18,True).render("Move Log",True,(0,0,0))
+        # Every move row pre-rendered; draw() blits the visible slice
+        self._log_surface = None
+        self._render_log()
 
     def add_move(self, san, is_white):
         if is_white:
@@ -239,6 +324,9 @@ class ScrollableMoveLog:
                 self.current_move_number += 1
         self._update_scroll_limits()
         self._auto_scroll_to_bottom()
+        # Only the last row changes: a new white move or black's reply to it
+        self._ensure_log_capacity()
+        self._render_row(len(self.moves)-1)
 
     def clear(self):
         self.moves = []
@@ -246,6 +334,38 @@ class ScrollableMoveLog:
         self.waiting_for_black = False
         self.scroll_y = 0
         self.max_scroll = 0
+        self._render_log()
+
+    def _ensure_log_capacity(self):
+        """Make the log surface tall enough for every row (True if reallocated)"""
+        width = self.rect.width-15
+        height = max(self.rect.height-50, len(self.moves)*self.line_height)
+        old = self._log_surface
+        if old is not None and old.get_height() >= height:
+            return False
+        # Grow geometrically so long games don't reallocate every move
+        if old is not None:
+            height = max(height, 2*old.get_height())
+        self._log_surface = pygame.Surface((width, height)).convert()
+        self._log_surface.fill((240,240,240))
+        if old is not None:
+            self._log_surface.blit(old, (0,0))
+        return True
+
+    def _render_row(self, i):
+        """Re-render move row i onto the log surface"""
+        mn,ws,bs = self.moves[i]
+        txt = f"{mn:2d} {ws:8s} {bs:8s}"
+        y = i*self.line_height
+        self._log_surface.fill((240,240,240), (0, y, self._log_surface.get_width(), self.line_height))
+        self._log_surface.blit(get_font("Consolas",16).render(txt,True,(0,0,0)), (0, y))
+
+    def _render_log(self):
+        """Re-render all move rows onto the offscreen log surface"""
+        self._ensure_log_capacity()
+        self._log_surface.fill((240,240,240))
+        for i in range(len(self.moves)):
+            self._render_row(i)
 
     def _update_scroll_limits(self):
         total = len(self.moves)
@@ -268,27 +388,14 @@ class ScrollableMoveLog:
     def draw(self, screen):
         content = pygame.Rect(self.rect.x, self.rect.y, self.rect.width-5, self.rect.height)
         pygame.draw.rect(screen, (240,240,240), content)
-        pygame.draw.rect(screen, (0,0,0), content, 1)
 
-        title = pygame.font.SysFont("Verdana",18,True).render("Move Log",True,(0,0,0))
-        screen.blit(title, (self.rect.x+10, self.rect.y+5))
-        
-        mv_area = pygame.Rect(self.rect.x, self.rect.y+50, content.width, self.rect.height-50)
-        oc = screen.get_clip()
-        screen.set_clip(mv_area)
-
-        start = int(self.scroll_y//self.line_height)
-        end = min(len(self.moves), start+self.visible_lines+2)
-        y0 = mv_area.y - (self.scroll_y%self.line_height)
-        font = pygame.font.SysFont("Consolas",16)
-        for i in range(start, end):
-            mn,ws,bs = self.moves[i]
-            txt = f"{mn:2d} {ws:8s} {bs:8s}"
-            y = y0 + (i-start)*self.line_height
-            if mv_area.y <= y < mv_area.bottom:
-                screen.blit(font.render(txt,True,(0,0,0)), (self.rect.x+10, y))
-
-        screen.set_clip(oc)
+        screen.blit(self._title_surf, (self.rect.x+10, self.rect.y+5))
+
+        visible = pygame.Rect(0, self.scroll_y, self._log_surface.get_width(), self.rect.height-50)
+        screen.blit(self._log_surface, (self.rect.x+10, self.rect.y+50), visible)
+
+        # Border last so the log slice can't cover it
+        pygame.draw.rect(screen, (0,0,0), content, 1)
 
 # ---------------------------------------------------------------------------
 # UCI Engine wrapper
@@ -303,6 +410,38 @@ class UCIEngine:
             self.engine = None
         self.lock = threading.Lock()
 
+        # One long-lived worker serves all move requests
+        self._q = queue.Queue()
+        self._result_q = queue.Queue()
+        self._latest_token = None
+        if self.engine:
+            threading.Thread(target=self._worker, daemon=True).start()
+
+    def _worker(self):
+        while True:
+            job = self._q.get()
+            if job is None:
+                return
+            token, board, thinking_time = job
+            if token != self._latest_token:
+                continue  # superseded by a newer request; its result would be dropped
+            self._result_q.put((token, self.best_move(board, thinking_time)))
+
+    def request_move(self, token, board, thinking_time=1.5):
+        """Queue a search; the result comes back from poll_move tagged with token.
+
+        Only the newest request is searched; older queued ones are skipped.
+        """
+        self._latest_token = token
+        self._q.put((token, board, thinking_time))
+
+    def poll_move(self):
+        """Return a finished (token, move) pair, or None if nothing is ready"""
+        try:
+            return self._result_q.get_nowait()
+        except queue.Empty:
+            return None
+
     def best_move(self, board, thinking_time=1.5):
         if not self.engine:
             return None
@@ -314,6 +453,7 @@ class UCIEngine:
 
     def quit(self):
         if self.engine:
+            self._q.put(None)
             with self.lock:
                 try:
                     self.engine.quit()
@@ -350,8 +490,35 @@ class ChessGUI:
         self.screen = pygame.display.set_mode(WIN_SIZE)
         self.clock  = pygame.time.Clock()
 
-        global PIECE_IMAGES
+        # Queue only the events handle_events reacts to (skips mouse motion etc.)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEWHEEL,
+                                  pygame.MOUSEBUTTONDOWN, pygame.VIDEOEXPOSE,
+                                  pygame.ACTIVEEVENT,
+                                  CHECK_SOUND_EVENT, END_SOUND_EVENT])
+
+        global PIECE_IMAGES, PIECE_IMG_TABLE
         PIECE_IMAGES = load_piece_images()
+        PIECE_IMG_TABLE = piece_image_table(PIECE_IMAGES)
+
+        # Static backgrounds, baked once and blitted every frame
+        self._board_surface = pygame.Surface((BOARD_SIZE, BOARD_SIZE)).convert()
+        for rank in range(8):
+            for file in range(8):
+                rect = pygame.Rect(file*SQUARE_SIZE, rank*SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+                color = LIGHT if (file+rank)%2==0 else DARK
+                pygame.draw.rect(self._board_surface, color, rect)
+        self._panel_surface = pygame.Surface((SIDE_PANEL_W, BOARD_SIZE)).convert()
+        self._panel_surface.fill((225,225,225))
+        self._render_instructions(self._panel_surface)
+
+        # Square overlays, filled once and reused every frame
+        self._last_move_surf = pygame.Surface((SQUARE_SIZE,SQUARE_SIZE), pygame.SRCALPHA)
+        self._last_move_surf.fill((255,255,0,90))
+        self._check_surf = pygame.Surface((SQUARE_SIZE,SQUARE_SIZE), pygame.SRCALPHA)
+        self._check_surf.fill((255,0,0,100))
+        self._select_surf = pygame.Surface((SQUARE_SIZE,SQUARE_SIZE), pygame.SRCALPHA)
+        pygame.draw.rect(self._select_surf, BLUE, self._select_surf.get_rect(), 3)
 
         # Initialize audio system
         self.audio = ChessAudio()
@@ -363,16 +530,34 @@ class ChessGUI:
         self.mode = Mode.HUMAN_VS_ENGINE
 
         self.selected_sq = None
-        self.valid_dest_sqs = []
+        self.valid_dest_mask = chess.SquareSet()
         self.last_move = None
         self.running = True
 
-        self.engine_thread = None
-        self.pending_engine_move = None
+        # Redraw only when something visible changed, and never while minimized
+        self._dirty = True
+        self._clock_shown = None
+        self._visible = True
+
+        # Bumped on every reset so results of abandoned searches are dropped
+        self.engine_token = 0
+        self.engine_thinking = False
+
+        # (image, pos) pairs for the pieces, rebuilt only when the board changes
+        self._piece_blits = []
+        self._rebuild_piece_blits()
+
+        # Board predicates for the current position; cleared on every board change
+        self._pos_cache = {}
 
         # Audio toggle button
         self.audio_btn_rect = pygame.Rect(BOARD_SIZE+20, 130, 160, 28)
 
+        # Rendered side-panel text, re-rendered only when its state changes
+        self._mode_label = (None, None)
+        self._btn_label = (None, None)
+        self._outcome_label = (None, None)
+
         self.game_clock.start_turn()
         self.maybe_start_engine_think()
         
@@ -383,15 +568,17 @@ class ChessGUI:
         while self.running:
             self.handle_events()
             self.handle_engine()
-            self.draw()
+            if not self._visible:
+                pygame.time.wait(50)
+                continue
+            if self._dirty or self._clock_changed():
+                self.draw()
             self.clock.tick(FPS)
         self.engine.quit()
         pygame.quit()
         sys.exit()
 
     def handle_events(self):
-        keys = pygame.key.get_pressed()
-
         for e in pygame.event.get():
             if e.type == pygame.QUIT:
                 self.running = False
@@ -403,22 +590,37 @@ class ChessGUI:
                 elif e.key == pygame.K_m:  # Toggle audio with 'M' key
                     enabled = self.audio.toggle_audio()
                     print(f"Audio {'enabled' if enabled else 'disabled'}")
+                    self._dirty = True
                 elif e.key == pygame.K_ESCAPE:
                     self.selected_sq = None
-                    self.valid_dest_sqs = []
+                    self.valid_dest_mask = chess.SquareSet()
+                    self._dirty = True
+            elif e.type == CHECK_SOUND_EVENT:
+                self.audio.play_check_sound()
+            elif e.type == END_SOUND_EVENT:
+                self.audio.play_game_end_sound()
             elif e.type == pygame.MOUSEWHEEL:
-                self.move_log.handle_mouse_wheel(e)
+                if self.move_log.handle_mouse_wheel(e):
+                    self._dirty = True
             elif e.type == pygame.MOUSEBUTTONDOWN:
                 if e.button == 1:
                     if self.audio_btn_rect.collidepoint(e.pos):
                         enabled = self.audio.toggle_audio()
                         print(f"Audio {'enabled' if enabled else 'disabled'}")
+                        self._dirty = True
                     else:
                         self.on_click(e.pos)
+            elif e.type == pygame.VIDEOEXPOSE:
+                self._dirty = True
+            elif e.type == pygame.ACTIVEEVENT and e.state & pygame.APPACTIVE:
+                # Window minimized (gain 0) or restored (gain 1)
+                self._visible = bool(e.gain)
+                self._dirty = True
 
     def change_mode(self):
         """Change mode with audio feedback and board reset"""
         self.stop_engine()
+        self.cancel_sound_timers()
         
         modes = list(Mode)
         idx = (modes.index(self.mode) + 1) % len(modes)
@@ -427,13 +629,15 @@ class ChessGUI:
         # Reset board and game state
         self.board.reset()
         self.selected_sq = None
-        self.valid_dest_sqs = []
+        self.valid_dest_mask = chess.SquareSet()
         self.last_move = None
-        self.pending_engine_move = None
         
-        self.game_clock = Clock()
+        self.game_clock.reset()
         self.game_clock.start_turn()
         self.move_log.clear()
+        self._rebuild_piece_blits()
+        self._pos_cache.clear()
+        self._dirty = True
         
         print(f"Mode changed to: {MODE_NAMES[self.mode]}")
         
@@ -443,19 +647,28 @@ class ChessGUI:
 
     def stop_engine(self):
         """Stop any ongoing engine calculations"""
-        self.pending_engine_move = None
+        self.engine_token += 1
+        self.engine_thinking = False
+
+    def cancel_sound_timers(self):
+        """Drop check/game-end sounds still scheduled from the previous game"""
+        pygame.time.set_timer(CHECK_SOUND_EVENT, 0)
+        pygame.time.set_timer(END_SOUND_EVENT, 0)
 
     def new_game(self):
         """Start a new game in current mode"""
         self.stop_engine()
+        self.cancel_sound_timers()
         
         self.board.reset()
         self.selected_sq = None
-        self.valid_dest_sqs = []
-        self.pending_engine_move = None
-        self.game_clock = Clock()
+        self.valid_dest_mask = chess.SquareSet()
+        self.game_clock.reset()
         self.move_log.clear()
         self.last_move = None
+        self._rebuild_piece_blits()
+        self._pos_cache.clear()
+        self._dirty = True
         
         self.game_clock.start_turn()
         self.audio.play_game_start_sound()
@@ -471,6 +684,7 @@ class ChessGUI:
         r = 7 - y//SQUARE_SIZE
         sq = chess.square(f,r)
         piece = self.board.piece_at(sq)
+        self._dirty = True
 
         if self.selected_sq is None:
             if piece and (
@@ -480,17 +694,18 @@ class ChessGUI:
                 self.mode in (Mode.HUMAN_VS_HUMAN,Mode.ENGINE_VS_HUMAN)) or
                self.mode==Mode.ANALYSIS):
                 self.selected_sq = sq
-                self.valid_dest_sqs = [
-                    m.to_square for m in self.board.legal_moves
-                    if m.from_square==sq
-                ]
+                self.valid_dest_mask = chess.SquareSet(
+                    m.to_square for m in
+                    self.board.generate_legal_moves(from_mask=chess.BB_SQUARES[sq])
+                )
         else:
-            mv = chess.Move(self.selected_sq, sq)
-            if mv in self.board.legal_moves:
-                self.make_move(mv)
+            # Destinations come from legal moves of the selected piece;
+            # make_move fills in the promotion piece
+            if sq in self.valid_dest_mask:
+                self.make_move(chess.Move(self.selected_sq, sq))
             else:
                 self.selected_sq=None
-                self.valid_dest_sqs=[]
+                self.valid_dest_mask=chess.SquareSet()
 
     def make_move(self, move):
         """Make a move with audio feedback"""
@@ -511,46 +726,95 @@ class ChessGUI:
         self.board.push(move)
         self.last_move = move
         self.move_log.add_move(san, is_white)
+        self._rebuild_piece_blits()
+        self._pos_cache.clear()
+        self._dirty = True
         
-        # Check for check after the move
-        if self.board.is_check():
-            # Small delay to let move sound play first
-            pygame.time.wait(200)
-            self.audio.play_check_sound()
+        # Check for check after the move; delayed to let the move sound play first
+        delay = 0
+        if self._is_check():
+            delay += 200
+            pygame.time.set_timer(CHECK_SOUND_EVENT, delay, loops=1)
         
         # Check for game end
         if self.board.is_game_over():
-            pygame.time.wait(400)
-            self.audio.play_game_end_sound()
+            delay += 400
+            pygame.time.set_timer(END_SOUND_EVENT, delay, loops=1)
 
         if self.mode!=Mode.ANALYSIS:
             self.game_clock.start_turn()
         self.selected_sq=None
-        self.valid_dest_sqs=[]
+        self.valid_dest_mask=chess.SquareSet()
         self.maybe_start_engine_think()
 
     def maybe_start_engine_think(self):
         if not self.engine.engine:
             return
-        if self.engine_thread and self.engine_thread.is_alive():
+        if self.engine_thinking:
             return
         if self.board.is_game_over():
             return
         side = self.board.turn
         if ((side==chess.WHITE and self.mode in (Mode.ENGINE_VS_HUMAN,Mode.ENGINE_VS_ENGINE))
             or (side==chess.BLACK and self.mode in (Mode.HUMAN_VS_ENGINE,Mode.ENGINE_VS_ENGINE))):
-            self.engine_thread = threading.Thread(target=self.engine_calculate, daemon=True)
-            self.engine_thread.start()
-
-    def engine_calculate(self):
-        self.pending_engine_move = self.engine.best_move(self.board)
+            self.engine_thinking = True
+            self.engine.request_move(self.engine_token, self.board.copy(stack=False))
 
     def handle_engine(self):
-        if self.pending_engine_move:
-            self.make_move(self.pending_engine_move)
-            self.pending_engine_move = None
+        result = self.engine.poll_move()
+        if result is None:
+            return
+        token, move = result
+        if token != self.engine_token:
+            return  # search started before the last reset
+        self.engine_thinking = False
+        if move:
+            self.make_move(move)
+
+    def _rebuild_piece_blits(self):
+        """Recompute the piece sprites to blit; call after every board change"""
+        blits = []
+        for color in chess.COLORS:
+            for piece_type in chess.PIECE_TYPES:
+                img = PIECE_IMG_TABLE[piece_type | (color << 3)]
+                for sq in chess.scan_forward(self.board.pieces_mask(piece_type, color)):
+                    blits.append((img, _SQ_PIXELS[sq]))
+        self._piece_blits = blits
+
+    def _is_check(self):
+        if 'check' not in self._pos_cache:
+            self._pos_cache['check'] = self.board.is_check()
+        return self._pos_cache['check']
+
+    def _board_outcome(self):
+        """Outcome label from the position alone (None while the game goes on)"""
+        if 'outcome' not in self._pos_cache:
+            outcome = None
+            if self.board.is_checkmate():
+                winner = "White" if self.board.turn==chess.BLACK else "Black"
+                outcome = f"{winner} wins"
+            elif self.board.is_stalemate():
+                outcome = "Stalemate"
+            elif self.board.is_insufficient_material():
+                outcome = "Draw"
+            elif self.board.is_repetition(3) or self.board.is_fivefold_repetition():
+                outcome = "Repetition"
+            elif self.board.is_fifty_moves():
+                outcome = "50-move rule"
+            self._pos_cache['outcome'] = outcome
+        return self._pos_cache['outcome']
+
+    def _clock_changed(self):
+        """True when the clock's displayed seconds differ from the last frame"""
+        shown = (int(self.game_clock.remaining[chess.WHITE]),
+                 int(self.game_clock.remaining[chess.BLACK]))
+        if shown != self._clock_shown:
+            self._clock_shown = shown
+            return True
+        return False
 
     def draw(self):
+        self._dirty = False
         self.screen.fill((0,0,0))
         self.draw_board()
         self.draw_side_panel()
@@ -558,61 +822,43 @@ class ChessGUI:
 
     def draw_board(self):
         # Base squares
-        for rank in range(8):
-            for file in range(8):
-                sq = chess.square(file,7-rank)
-                rect = pygame.Rect(file*SQUARE_SIZE, rank*SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
-                color = LIGHT if (file+rank)%2==0 else DARK
-                pygame.draw.rect(self.screen, color, rect)
+        self.screen.blit(self._board_surface, (0,0))
 
         # Highlight last move
         if self.last_move:
-            surf = pygame.Surface((SQUARE_SIZE,SQUARE_SIZE), pygame.SRCALPHA)
-            surf.fill((255,255,0,90))
             for sq in (self.last_move.from_square, self.last_move.to_square):
-                f = chess.square_file(sq)
-                r = chess.square_rank(sq)
-                self.screen.blit(surf, (f*SQUARE_SIZE, (7-r)*SQUARE_SIZE))
+                self.screen.blit(self._last_move_surf, _SQ_PIXELS[sq])
 
         # Highlight check
-        if self.board.is_check():
+        if self._is_check():
             ksq = self.board.king(self.board.turn)
             if ksq is not None:
-                surf = pygame.Surface((SQUARE_SIZE,SQUARE_SIZE), pygame.SRCALPHA)
-                surf.fill((255,0,0,100))
-                f = chess.square_file(ksq)
-                r = chess.square_rank(ksq)
-                self.screen.blit(surf, (f*SQUARE_SIZE, (7-r)*SQUARE_SIZE))
+                self.screen.blit(self._check_surf, _SQ_PIXELS[ksq])
 
         # Highlight selection and legal destinations
-        for rank in range(8):
-            for file in range(8):
-                sq = chess.square(file,7-rank)
-                rect = pygame.Rect(file*SQUARE_SIZE, rank*SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
-                if sq == self.selected_sq or sq in self.valid_dest_sqs:
-                    pygame.draw.rect(self.screen, BLUE, rect, 3)
+        if self.selected_sq is not None:
+            for sq in [self.selected_sq, *self.valid_dest_mask]:
+                self.screen.blit(self._select_surf, _SQ_PIXELS[sq])
 
         # Draw pieces
-        for sq in chess.SQUARES:
-            piece = self.board.piece_at(sq)
-            if piece:
-                f = chess.square_file(sq)
-                r = 7 - chess.square_rank(sq)
-                key = ('w' if piece.color==chess.WHITE else 'b') + piece.symbol().upper()
-                self.screen.blit(PIECE_IMAGES[key], (f*SQUARE_SIZE, r*SQUARE_SIZE))
+        self.screen.blits(self._piece_blits, doreturn=False)
 
     def draw_side_panel(self):
-        pygame.draw.rect(self.screen, (225,225,225), pygame.Rect(BOARD_SIZE,0,SIDE_PANEL_W,BOARD_SIZE))
+        self.screen.blit(self._panel_surface, (BOARD_SIZE,0))
         
-        font = pygame.font.SysFont("Verdana",22,True)
-        self.screen.blit(font.render(f"Mode: {MODE_NAMES[self.mode]}",True,(0,0,0)), (BOARD_SIZE+20,100))
+        if self._mode_label[0] != self.mode:
+            font = get_font("Verdana",22,True)
+            self._mode_label = (self.mode, font.render(f"Mode: {MODE_NAMES[self.mode]}",True,(0,0,0)))
+        self.screen.blit(self._mode_label[1], (BOARD_SIZE+20,100))
 
         # Audio toggle button
-        btn_color = (100, 255, 100) if self.audio.audio_enabled else (255, 100, 100)
+        enabled = self.audio.audio_enabled
+        btn_color = (100, 255, 100) if enabled else (255, 100, 100)
         pygame.draw.rect(self.screen, btn_color, self.audio_btn_rect, border_radius=4)
-        btn_text = "Audio: ON" if self.audio.audio_enabled else "Audio: OFF"
-        btn_font = pygame.font.SysFont("Verdana", 16)
-        text_surf = btn_font.render(btn_text, True, (0,0,0))
+        if self._btn_label[0] != enabled:
+            btn_text = "Audio: ON" if enabled else "Audio: OFF"
+            self._btn_label = (enabled, get_font("Verdana", 16).render(btn_text, True, (0,0,0)))
+        text_surf = self._btn_label[1]
         text_rect = text_surf.get_rect(center=self.audio_btn_rect.center)
         self.screen.blit(text_surf, text_rect)
 
@@ -622,29 +868,23 @@ class ChessGUI:
         self.move_log.draw(self.screen)
 
         # Game outcome
-        outcome = None
         if self.game_clock.flag() and self.mode!=Mode.ANALYSIS:
             outcome = "Time forfeit"
-        elif self.board.is_checkmate():
-            winner = "White" if self.board.turn==chess.BLACK else "Black"
-            outcome = f"{winner} wins"
-        elif self.board.is_stalemate():
-            outcome = "Stalemate"
-        elif self.board.is_insufficient_material():
-            outcome = "Draw"
-        elif self.board.is_repetition(3) or self.board.is_fivefold_repetition():
-            outcome = "Repetition"
-        elif self.board.is_fifty_moves():
-            outcome = "50-move rule"
+        else:
+            outcome = self._board_outcome()
         
         if outcome:
-            of = pygame.font.SysFont("Verdana",18,True)
-            lbl = of.render(outcome,True,BLUE)
+            if self._outcome_label[0] != outcome:
+                self._outcome_label = (outcome, get_font("Verdana",18,True).render(outcome,True,BLUE))
+            lbl = self._outcome_label[1]
             tr = lbl.get_rect(centerx=BOARD_SIZE+SIDE_PANEL_W//2, y=480)
             self.screen.blit(lbl, tr)
 
-        # Instructions
-        font2 = pygame.font.SysFont("Consolas",14)
+        # Instructions are baked into _panel_surface
+
+    def _render_instructions(self, panel):
+        """Draw the static instruction lines onto the side-panel background"""
+        font2 = get_font("Consolas",14)
         lines = [
             "N  : new game",
             "SPACE: change mode + reset", 
@@ -663,7 +903,7 @@ class ChessGUI:
         y=500
         for txt in lines:
             if y>BOARD_SIZE-20: break
-            self.screen.blit(font2.render(txt,True,(0,0,0)), (BOARD_SIZE+10,y))
+            panel.blit(font2.render(txt,True,(0,0,0)), (10,y))
             y+=16
 
 if __name__ == "__main__":